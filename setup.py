@@ -1,18 +1,151 @@
 import os
 import json
+import logging
+import itertools
+import shutil
+import string
 import time
+import atexit
 import subprocess
+import tempfile
 import requests
 import argparse
 import urllib.parse
 from dotenv import load_dotenv
-from google.cloud import pubsub_v1
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 PROVISIONING_SERVICE_HOST = os.getenv('PROVISIONING_SERVICE_HOST', 'http://localhost:8007')
+KAI_ADDRESS = "http://localhost:8005"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+logger = logging.getLogger('orbit-setup')
+
+# (connect, read) timeouts; sync-schemas is LLM-backed and gets a longer read
+HTTP_TIMEOUT = (3, 30)
+SYNC_SCHEMAS_TIMEOUT = (3, 120)
+
+# Shared HTTP session so KAI and notification calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=4,
+        connect=3,
+        read=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        # POSTs here are not idempotent (connection create, schema sync, agent
+        # publish), so only connect errors are retried for them, never a read
+        # timeout or 5xx that the server may already have acted on
+        allowed_methods=frozenset(["GET"])
+    )
+))
+SESSION.headers.update({"Content-Type": "application/json"})
+atexit.register(SESSION.close)
+
+# Readiness probes must fail fast so wait_for_kai's own backoff and deadline
+# govern the wait, so this session never retries at the adapter level
+PROBE_SESSION = requests.Session()
+PROBE_SESSION.mount("http://", HTTPAdapter(max_retries=0))
+atexit.register(PROBE_SESSION.close)
+
+def post_json(session, url, payload=None, timeout=HTTP_TIMEOUT, **kwargs):
+    """POST a JSON payload and return the response, raising on HTTP errors"""
+    response = session.post(url, json=payload, timeout=timeout, **kwargs)
+    response.raise_for_status()
+    return response
+
+_PAYLOAD_TMPL = {
+    "process_id": None,
+    "step": "",
+    "step_order": 0,
+    "status": "success",
+    "message": "",
+    "modified_at": ""
+}
+
+def _now_iso():
+    """Current UTC time as a second-precision ISO-8601 string"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+def make_payload(process_id, step, step_order, message):
+    """Build a step notification payload from the shared template"""
+    payload = _PAYLOAD_TMPL.copy()
+    payload.update(process_id=process_id, step=step, step_order=step_order, message=message)
+    payload["modified_at"] = _now_iso()
+    return payload
+
+# Step notifications are not on the critical path, so they are posted from
+# a single background worker (keeping them in step order) while provisioning
+# carries on; failures surface when main collects the futures
+NOTIFY_POOL = ThreadPoolExecutor(max_workers=1)
+NOTIFY_FUTURES = []
+
+def send_notification(process_payload, jwt_token):
+    """Deliver a step notification to the provisioning service"""
+    post_json(
+        SESSION,
+        f"{PROVISIONING_SERVICE_HOST}/api/v1/provision/orbit/notification",
+        process_payload,
+        headers={"Authorization": jwt_token}
+    )
+    logger.info("Notification sent to main service: %s", process_payload['step'])
+
+def notify_async(process_payload, jwt_token):
+    """Queue a step notification without waiting for it to be delivered"""
+    NOTIFY_FUTURES.append(NOTIFY_POOL.submit(send_notification, process_payload, jwt_token))
+
+def wait_for_notifications():
+    """Wait for queued notifications, re-raising the first delivery failure"""
+    try:
+        for future in NOTIFY_FUTURES:
+            future.result()
+    finally:
+        NOTIFY_FUTURES.clear()
+
+# (argument name, path into config.json, default) for every config-sourced value
+CONFIG_SCHEMA = [
+    ('api_key', ('api_key',), None),
+    ('jwt_token', ('data', 'jwt_token'), None),
+    ('db_connection_uri', ('data', 'orbit_configuration', 'connection_string'), None),
+    ('db_host', ('data', 'orbit_configuration', 'db_connection', 'host'), None),
+    ('db_port', ('data', 'orbit_configuration', 'db_connection', 'port'), 5432),
+    ('db_name', ('data', 'orbit_configuration', 'db_connection', 'database'), None),
+    ('db_user', ('data', 'orbit_configuration', 'db_connection', 'username'), None),
+    ('db_password', ('data', 'orbit_configuration', 'db_connection', 'password'), None),
+    ('agent_name', ('data', 'agent', 'agent_name'), None),
+    ('agent_description', ('data', 'agent', 'agent_description'), None),
+]
+
+# Fields that must be set for each process type (API key is optional when
+# the services are already deployed)
+REQUIRED_FIELDS = {
+    'initial_provisioning_orbit': ('api_key',),
+    'create_agent_orbit': (),
+}
+
+# Readable names for REQUIRED_FIELDS entries in validation errors
+FIELD_LABELS = {
+    'api_key': 'API key',
+}
+
+# Individual connection parameters required when no connection URI is given
+DB_PARAM_FIELDS = ('db_host', 'db_name', 'db_user', 'db_password')
+
+def _walk(d, path):
+    """Follow a key path through nested dicts, returning None if any step is missing"""
+    for key in path:
+        d = d.get(key) if isinstance(d, dict) else None
+        if d is None:
+            return None
+    return d
 
-print(PROVISIONING_SERVICE_HOST)
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Setup Orbit services and configuration')
@@ -35,53 +168,31 @@ def parse_args():
     parser.add_argument('--agent-name', help='Name of the agent')
     parser.add_argument('--agent-description', help='Description of the agent')
     parser.add_argument('--jwt-token', help='JWT token for authentication')
+
+    # Output configuration
+    parser.add_argument('--quiet', action='store_true', help='Hide docker compose progress output (errors are still shown)')
     
     args = parser.parse_args()
     
     # If config file is provided, load and validate it
     if args.config:
         try:
-            with open(args.config, 'r') as f:
-                config = json.load(f)
+            config = json.loads(Path(args.config).read_bytes())
             
             # Extract values from config
             args.data = config
-            args.api_key = args.data.get('api_key')
-            data = args.data.get('data', {})
-            
-            # Extract JWT token and orbit configuration
-            args.jwt_token = data.get('jwt_token')
+            for name, path, default in CONFIG_SCHEMA:
+                setattr(args, name, _walk(config, path) or default)
             
-            # Extract orbit configuration
-            orbit_config = data.get('orbit_configuration', {})
-            args.db_connection_uri = orbit_config.get('connection_string')
-            
-            db_conn = orbit_config.get('db_connection')
-            if db_conn:
-                args.db_host = db_conn.get('host')
-                args.db_port = db_conn.get('port')
-                args.db_name = db_conn.get('database')
-                args.db_user = db_conn.get('username')
-                args.db_password = db_conn.get('password')
-            
-            # Extract agent configuration
-            agent = data.get('agent', {})
-            args.agent_name = agent.get('agent_name')
-            args.agent_description = agent.get('agent_description')
-            
-            # Validate required fields based on process type
-            if args.data.get("process_type") == "initial_provisioning_orbit":
-                if not args.api_key:
-                    raise ValueError("API key is required for initial_provisioning_orbit")
-            elif args.data.get("process_type") == "create_agent_orbit":
-                # API key not required for agent creation
-                pass
-            else:
-                # For any other process type or when process_type is not specified
-                if not args.api_key:
-                    raise ValueError("API key is required when process_type is not specified")
-                    
-            if not (args.db_connection_uri or (db_conn and all([args.db_host, args.db_name, args.db_user, args.db_password]))):
+            # Validate required fields based on process type; unknown or
+            # missing process types fall back to requiring the API key
+            process_type = args.data.get("process_type")
+            for field in REQUIRED_FIELDS.get(process_type, ('api_key',)):
+                if not getattr(args, field):
+                    context = f"for {process_type}" if process_type else "when process_type is not specified"
+                    raise ValueError(f"{FIELD_LABELS.get(field, field)} is required {context}")
+
+            if not (args.db_connection_uri or all(getattr(args, f) for f in DB_PARAM_FIELDS)):
                 raise ValueError("Missing database configuration. Provide either connection_string or db_connection details")
                 
         except (json.JSONDecodeError, FileNotFoundError) as e:
@@ -97,211 +208,300 @@ def parse_args():
         }
         
         # Validate database configuration
-        if not args.db_connection_uri and not all([args.db_host, args.db_name, args.db_user, args.db_password]):
+        if not (args.db_connection_uri or all(getattr(args, f) for f in DB_PARAM_FIELDS)):
             raise ValueError("When not using --config or --db-connection-uri, you must specify --db-host, --db-name, --db-user, and --db-password")
     
     return args
 
+def _quote_pw(pw, _safe=frozenset(string.ascii_letters + string.digits + '-._~')):
+    """URL encode a password, skipping the work when every character is already safe"""
+    return pw if all(c in _safe for c in pw) else urllib.parse.quote_plus(pw)
+
 def build_connection_uri(args):
     """Build database connection URI from individual parameters"""
     if args.db_connection_uri:
         return args.db_connection_uri
         
     # Validate required parameters when using individual connection details
-    if not all([args.db_host, args.db_name, args.db_user, args.db_password]):
+    if not all(getattr(args, f) for f in DB_PARAM_FIELDS):
         raise ValueError("When not using --db-connection-uri, you must specify --db-host, --db-name, --db-user, and --db-password")
     
     # Build connection URI
-    password = urllib.parse.quote_plus(args.db_password)  # URL encode the password
+    password = _quote_pw(args.db_password)  # URL encode the password
     return f"postgresql://{args.db_user}:{password}@{args.db_host}:{args.db_port}/{args.db_name}"
 
-def run_docker_compose(api_key, args):
-    """Deploy KAI and orbit worker services using docker-compose"""
+def _db_identity(uri):
+    """Database a connection URI points at, ignoring the password, or None if unparseable"""
     try:
-        # Create the required Docker network if it doesn't exist
+        parts = urllib.parse.urlsplit(uri)
+        if not parts.hostname:
+            return None
+        # The query is kept so an sslmode variant counts as a distinct connection
+        return (parts.scheme, parts.hostname, parts.port or 5432, parts.username, parts.path, parts.query)
+    except ValueError:
+        return None
+
+def wait_for_kai(session, url, deadline=60, initial=0.25):
+    """Poll KAI until it answers HTTP requests, backing off exponentially"""
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+    while True:
         try:
-            subprocess.run(['docker', 'network', 'create', 'agentic_network'], check=True)
-            print("Docker network 'agentic_network' created successfully")
-        except subprocess.CalledProcessError:
-            # Network might already exist, which is fine
+            response = session.get(url, timeout=(1, 2))
+            if response.status_code < 500:
+                return
+        except requests.exceptions.RequestException:
+            # Connection refused or reset while the container is still booting
             pass
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(f"KAI service at {url} not ready after {deadline} seconds")
+        time.sleep(min(initial * 2 ** attempt, 2.0, remaining))
+        attempt += 1
 
-        # Update .env.orbit file with the provided API key
-        env_orbit_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'docker',
-            '.env.orbit'
-        )
-        
-        # Read existing content
-        with open(env_orbit_path, 'r') as f:
-            lines = f.readlines()
-            
-        # Update the API key line
-        with open(env_orbit_path, 'w') as f:
-            for line in lines:
-                if line.startswith('ORBIT_API_KEY='):
-                    f.write(f'ORBIT_API_KEY={api_key}\n')
-                else:
-                    f.write(line)
-        
-        subprocess.run(['docker-compose', '-f', 'docker/docker-compose.yml', 'up', '-d'], check=True)
-        print("Docker services started successfully")
-        # Give services some time to start up
-        time.sleep(10)
+def ensure_network():
+    """Create the agentic_network Docker network if it doesn't exist"""
+    # A cheap inspect covers the common re-run case where the network exists
+    result = subprocess.run(
+        ['docker', 'network', 'inspect', 'agentic_network'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    if result.returncode == 0:
+        return
+    try:
+        subprocess.run(['docker', 'network', 'create', 'agentic_network'], check=True)
+        logger.info("Docker network 'agentic_network' created successfully")
+    except subprocess.CalledProcessError:
+        # Network might have been created concurrently, which is fine
+        pass
+
+API_KEY_PREFIX = b'ORBIT_API_KEY='
+
+def rewrite_env_file(env_orbit_path, api_key):
+    """Set ORBIT_API_KEY in the .env.orbit file, appending it if missing"""
+    new_line = f'ORBIT_API_KEY={api_key}\n'.encode()
+    lines = Path(env_orbit_path).read_bytes().splitlines(keepends=True)
+    out = [new_line if line.startswith(API_KEY_PREFIX) else line for line in lines]
+    if new_line not in out:
+        # Append the key, terminating an unfinished last line first
+        if out and not out[-1].endswith(b'\n'):
+            out[-1] += b'\n'
+        out.append(new_line)
+
+    # Write to a temp file next to the original and swap it in atomically,
+    # so a crash mid-write never leaves a truncated env file behind
+    tmp = tempfile.NamedTemporaryFile('wb', delete=False, dir=os.path.dirname(env_orbit_path))
+    try:
+        with tmp:
+            tmp.write(b''.join(out))
+        shutil.copymode(env_orbit_path, tmp.name)
+        os.replace(tmp.name, env_orbit_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+def compose_command():
+    """Return the compose CLI, preferring the docker compose v2 plugin"""
+    result = subprocess.run(
+        ['docker', 'compose', 'version'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    if result.returncode == 0:
+        return ['docker', 'compose']
+    return ['docker-compose']
+
+def run_docker_compose(api_key, args, step_counter):
+    """Deploy KAI and orbit worker services using docker-compose"""
+    process_id = args.data['process_id']
+    try:
+        env_orbit_path = os.path.join(SCRIPT_DIR, 'docker', '.env.orbit')
+
+        # Network creation and the compose version probe talk to the Docker
+        # daemon while the env file update is local I/O, so run them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            network_future = executor.submit(ensure_network)
+            env_future = executor.submit(rewrite_env_file, env_orbit_path, api_key)
+            compose_future = executor.submit(compose_command)
+            network_future.result()
+            env_future.result()
+            compose = compose_future.result()
+
+        # With the v2 plugin, --wait blocks until every healthcheck passes
+        wait_flags = ['--wait', '--wait-timeout', '60'] if compose == ['docker', 'compose'] else []
+        # In quiet mode only capture stderr, and surface it if compose fails
+        output = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE, 'text': True} if args.quiet else {}
+        subprocess.run(compose + ['-f', 'docker/docker-compose.yml', 'up', '-d'] + wait_flags, check=True, **output)
+        logger.info("Docker services started successfully")
+        if not wait_flags:
+            # Legacy docker-compose cannot wait on healthchecks, so poll KAI
+            wait_for_kai(PROBE_SESSION, f"{KAI_ADDRESS}/api/v1/database-connections")
+            logger.info("KAI service is ready")
 
-        if args.data["process_id"]:
+        if process_id:
             # Create a new process in the KAI service
-            args.data['step_order'] += 1
-            print(args.data['step_order'])
-            process_payload = {
-                "process_id": args.data['process_id'],
-                "step": "Docker compose services started",
-                "step_order": args.data['step_order'],
-                "status": "success",
-                "message": "KAI service and orbit worker services started successfully",
-                "modified_at": datetime.now().isoformat()
-            }
-            response = requests.post(
-                f"{PROVISIONING_SERVICE_HOST}/api/v1/provision/orbit/notification",
-                headers={
-                    "Authorization": args.jwt_token,
-                    "Content-Type": "application/json"
-                },
-                json=process_payload
+            step_order = next(step_counter)
+            logger.debug("Step order: %s", step_order)
+            process_payload = make_payload(
+                process_id,
+                "Docker compose services started",
+                step_order,
+                "KAI service and orbit worker services started successfully"
             )
-            response.raise_for_status()
-            print("Notification sent to main service")
+            notify_async(process_payload, args.jwt_token)
         else:
             pass
 
     except subprocess.CalledProcessError as e:
-        print(f"Error starting docker services: {e}")
+        logger.error("Error starting docker services: %s", e)
+        if e.stderr:
+            logger.error("%s", e.stderr)
         raise
     except IOError as e:
-        print(f"Error updating .env.orbit file: {e}")
+        logger.error("Error updating .env.orbit file: %s", e)
         raise
 
 
 
-def configure_kai_service(connection_uri, args):
+def configure_kai_service(connection_uri, args, step_counter):
     """Configure KAI service with database connections and schemas"""
-    # Load environment variables
-    kai_address = "http://localhost:8005"
-    
+    process_id = args.data['process_id']
     try:
-        print("Configuring KAI service...")
-        print("Createing database connection...")
-        # Step 1: Create database connection
-        connection_payload = {
-            "alias": "orbit",
-            "connection_uri": connection_uri
-        }
-        print(f"Connection URI: {connection_uri}")
-        response = requests.post(
-            f"{kai_address}/api/v1/database-connections",
-            json=connection_payload
-        )
+        logger.info("Configuring KAI service...")
+        # Re-runs find the connection already registered; reuse it instead
+        # of creating a duplicate and re-syncing every table through the LLM.
+        # Only reuse it when the listed URI identifies the same database;
+        # a missing, masked or unparseable URI falls through to create
+        response = SESSION.get(f"{KAI_ADDRESS}/api/v1/database-connections", timeout=HTTP_TIMEOUT)
         response.raise_for_status()
-        db_connection_id = response.json().get('id')
-        
-        print(f"Database connection created with ID: {db_connection_id}")
-        print("Refreshing database...")
+        target = _db_identity(connection_uri)
+        existing = next(
+            (c for c in response.json()
+             if target is not None
+             and c.get('alias') == 'orbit'
+             and c.get('connection_uri')
+             and _db_identity(c['connection_uri']) == target),
+            None
+        )
+
+        if existing:
+            db_connection_id = existing['id']
+            logger.info("Reusing existing database connection with ID: %s", db_connection_id)
+        else:
+            logger.info("Createing database connection...")
+            # Step 1: Create database connection
+            connection_payload = {
+                "alias": "orbit",
+                "connection_uri": connection_uri
+            }
+            logger.info("Connection URI: %s", connection_uri)
+            response = post_json(
+                SESSION,
+                f"{KAI_ADDRESS}/api/v1/database-connections",
+                connection_payload
+            )
+            db_connection_id = response.json().get('id')
+
+            logger.info("Database connection created with ID: %s", db_connection_id)
+
+        logger.info("Refreshing database...")
         # Step 2: Refresh database
-        response = requests.post(
-            f"{kai_address}/api/v1/table-descriptions/refresh",
+        response = post_json(
+            SESSION,
+            f"{KAI_ADDRESS}/api/v1/table-descriptions/refresh",
             params={"database_connection_id": db_connection_id}
         )
-        response.raise_for_status()
         table_descriptions = response.json()
-        print(f"Table descriptions refreshed: {len(table_descriptions)} tables found")
-        print("Configuring schemas...")
-        # Step 3: Sync schemas
-        table_description_ids = [desc['id'] for desc in table_descriptions]
-        sync_payload = {
-            "table_description_ids": table_description_ids,
-            "instruction": "",
-            "llm_config": {
-                "model-family": "google",
-                "model-name": "gemini-2.0-flash"
+        logger.info("Table descriptions refreshed: %d tables found", len(table_descriptions))
+        # Step 3: Sync schemas, skipping tables an earlier run already scanned
+        table_description_ids = [
+            desc['id'] for desc in table_descriptions
+            if not existing or desc.get('status') != 'SCANNED'
+        ]
+        # Only the ids are needed from here on; release the raw body and the
+        # parsed descriptions before the long-running sync call
+        del response, table_descriptions
+        if table_description_ids:
+            logger.info("Configuring schemas...")
+            sync_payload = {
+                "table_description_ids": table_description_ids,
+                "instruction": "",
+                "llm_config": {
+                    "model-family": "google",
+                    "model-name": "gemini-2.0-flash"
+                }
             }
-        }
-        response = requests.post(
-            f"{kai_address}/api/v1/table-descriptions/sync-schemas",
-            json=sync_payload
-        )
-        response.raise_for_status()
-        print("KAI service configured successfully")
+            post_json(
+                SESSION,
+                f"{KAI_ADDRESS}/api/v1/table-descriptions/sync-schemas",
+                sync_payload,
+                timeout=SYNC_SCHEMAS_TIMEOUT
+            )
+        else:
+            logger.info("Schemas already up to date, skipping sync")
+        logger.info("KAI service configured successfully")
 
-        if args.data['process_id']:
+        if process_id:
             # Create a new process in the KAI service
-            args.data["step_order"] += 1
-            process_payload = {
-                "process_id": args.data['process_id'],
-                "step": "KAI service configured",
-                "step_order": args.data['step_order'],
-                "status": "success",
-                "message": "KAI service configured successfully",
-                "modified_at": datetime.now().isoformat()
-            }
-            response = requests.post(
-                f"{PROVISIONING_SERVICE_HOST}/api/v1/provision/orbit/notification",
-                headers={
-                    "Authorization": args.jwt_token,
-                    "Content-Type": "application/json"
-                },
-                json=process_payload
+            process_payload = make_payload(
+                process_id,
+                "KAI service configured",
+                next(step_counter),
+                "KAI service configured successfully"
             )
-            response.raise_for_status()
-            print("Notification sent to main service")
+            notify_async(process_payload, args.jwt_token)
         else:
             pass
         
         return db_connection_id
     except requests.exceptions.RequestException as e:
-        print(f"Error configuring KAI service: {e}")
+        logger.error("Error configuring KAI service: %s", e)
         raise
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    logger.info("Provisioning service host: %s", PROVISIONING_SERVICE_HOST)
     try:
         # Parse command line arguments
         args = parse_args()
         
         # Build connection URI from args
         connection_uri = build_connection_uri(args)
-        if args.data["process_type"] == "initial_provisioning_orbit":
-            print("Initial provisioning for orbit...")
+        data = args.data
+        step_counter = itertools.count(data.get('step_order', 0) + 1)
+        if data["process_type"] == "initial_provisioning_orbit":
+            logger.info("Initial provisioning for orbit...")
             # Step 1: Deploy services
-            run_docker_compose(args.api_key, args)
+            run_docker_compose(args.api_key, args, step_counter)
 
         # Step 2: Configure KAI service
         try:
-            db_connection_id = configure_kai_service(connection_uri, args)
+            db_connection_id = configure_kai_service(connection_uri, args, step_counter)
         except:
-            db_connection_id = configure_kai_service(connection_uri+"?sslmode=require", args)
+            db_connection_id = configure_kai_service(connection_uri+"?sslmode=require", args, step_counter)
         
         # Step 3: Publish completion message
-        if args.data['process_id']:
-            args.data['step_order'] += 1
-            process_payload = args.data
+        if data['process_id']:
+            # Make sure step notifications landed before the completion message
+            wait_for_notifications()
+            data['step_order'] = next(step_counter)
+            process_payload = data
             process_payload["db_connection_id"] = db_connection_id
-            response = requests.post(
+            post_json(
+                SESSION,
                 f"{PROVISIONING_SERVICE_HOST}/api/v1/provision/orbit/agent",
-                headers={
-                    "Authorization": args.jwt_token,
-                    "Content-Type": "application/json"
-                },
-                json=process_payload
+                process_payload,
+                headers={"Authorization": args.jwt_token}
             )
-            response.raise_for_status()
-            print("Publuished to agent creation topic")
+            logger.info("Publuished to agent creation topic")
         else:
             pass
         
-        print("Setup completed successfully!")
+        logger.info("Setup completed successfully!")
         
     except Exception as e:
-        print(f"Setup failed: {e}")
+        logger.error("Setup failed: %s", e)
         raise
 
 if __name__ == "__main__":